@@ -2,16 +2,46 @@
 
 import argparse
 import os
+import re
 import typing
 
 from pleskdistup import actions
-from pleskdistup.common import action, feedback, strings
+from pleskdistup.common import action, feedback
 from pleskdistup.phase import Phase
 from pleskdistup.upgrader import dist, DistUpgrader, DistUpgraderFactory, PathType
 
 import debian11to12.config
 
 
+DESC_MESSAGE_TEMPLATE = """Use this upgrader to dist-upgrade an {from_name} server with Plesk to {to_name}. The process consists of the following general stages:
+
+-- Preparation (about 5 minutes) - The OS is prepared for the conversion.
+-- Conversion (about 15 minutes) - Plesk and system dist-upgrade is performed.
+-- Finalization (about 5 minutes) - The server is returned to normal operation.
+
+The system will be rebooted after each of the stages, so reboot times
+should be added to get the total time estimate.
+
+To see the detailed plan, run the utility with the --show-plan option.
+
+For assistance, submit an issue here {url}
+and attach the feedback archive generated with --prepare-feedback or at least the log file.
+"""
+
+
+# The greedy "(.*\b)" spans the rest of the line after the host, suite and
+# component names included, so each pattern rewrites its last match there.
+# The 11.11 pattern has to be applied first, the 11 one would break it apart.
+_REPO_VERSION_11_11_RE = re.compile(r'(http|https)://([^/]+)/(.*\b)11\.11(\b.*)')
+_REPO_VERSION_11_RE = re.compile(r'(http|https)://([^/]+)/(.*\b)11(\b.*)')
+
+
+def _switch_apt_repository_line(line: str) -> str:
+    line = line.replace('bullseye', 'bookworm')
+    line = _REPO_VERSION_11_11_RE.sub(r'\g<1>://\g<2>/\g<3>12.7\g<4>', line)
+    return _REPO_VERSION_11_RE.sub(r'\g<1>://\g<2>/\g<3>12\g<4>', line)
+
+
 class Debian11to12Upgrader(DistUpgrader):
     _distro_from = dist.Debian("11")
     _distro_to = dist.Debian("12")
@@ -90,11 +120,9 @@ class Debian11to12Upgrader(DistUpgrader):
                 }),
             ],
             "Switch repositories": [
-                actions.AdoptAptRepositoriesUbuntu([
-                    strings.create_replace_string_function('bullseye', 'bookworm'),
-                    strings.create_replace_regexp_function(r'(http|https)://([^/]+)/(.*\b)11\.11(\b.*)', '\g<1>://\g<2>/\g<3>12.7\g<4>'),
-                    strings.create_replace_regexp_function(r'(http|https)://([^/]+)/(.*\b)11(\b.*)', '\g<1>://\g<2>/\g<3>12\g<4>'),
-                    ], name="modify apt repositories to new OS"
+                actions.AdoptAptRepositoriesUbuntu(
+                    [_switch_apt_repository_line],
+                    name="modify apt repositories to new OS",
                 ),
                 actions.SwitchPleskRepositories(to_os_version="12"),
             ],
@@ -135,23 +163,18 @@ class Debian11to12Upgrader(DistUpgrader):
         ]
 
     def parse_args(self, args: typing.Sequence[str]) -> None:
-        DESC_MESSAGE = f"""Use this upgrader to dist-upgrade an {self._distro_from} server with Plesk to {self._distro_to}. The process consists of the following general stages:
-
--- Preparation (about 5 minutes) - The OS is prepared for the conversion.
--- Conversion (about 15 minutes) - Plesk and system dist-upgrade is performed.
--- Finalization (about 5 minutes) - The server is returned to normal operation.
+        # The upgrader has no options of its own besides --help, so there
+        # is nothing to parse or report when no arguments are passed
+        if not args:
+            return
 
-The system will be rebooted after each of the stages, so reboot times
-should be added to get the total time estimate.
-
-To see the detailed plan, run the utility with the --show-plan option.
-
-For assistance, submit an issue here {self.issues_url}
-and attach the feedback archive generated with --prepare-feedback or at least the log file.
-"""
         parser = argparse.ArgumentParser(
             usage=argparse.SUPPRESS,
-            description=DESC_MESSAGE,
+            description=DESC_MESSAGE_TEMPLATE.format(
+                from_name=self._distro_from,
+                to_name=self._distro_to,
+                url=self.issues_url,
+            ),
             formatter_class=argparse.RawDescriptionHelpFormatter,
             add_help=False,
         )
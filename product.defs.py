@@ -1,17 +1,31 @@
 # Copyright 2023-2024. WebPros International GmbH. All rights reserved.
 # vim:ft=python:
 
+import re
+
 include_defs('//buck.defs.py')
 
 
+# Revisions already described, keyed by base path, to run `git describe`
+# at most once per build file
+_deb11to12_revisions = {}
+
+# Version is the part of the revision description before the first dash,
+# e.g. "1.2.3" of "v1.2.3-4-gabcdef"; a bare commit hash has no version
+_DEB11TO12_VERSION_RE = re.compile(r'v*([^-]*)-')
+
+
 # Function is necessary, because Buck won't allow
 # get_git_revision_description() to be called at the top level of an
 # included file due to get_base_path() call inside (so, you can't just
 # do REVISION = get_git_revision_description())
 def get_deb11to12_revision():
-    return get_git_revision_description()
+    path = get_full_base_path()
+    if path not in _deb11to12_revisions:
+        _deb11to12_revisions[path] = get_git_revision_description(path=path)
+    return _deb11to12_revisions[path]
 
 
 def get_deb11to12_version():
-    rev = get_deb11to12_revision()
-    return rev.lstrip('v').split('-', 1)[0] if '-' in rev else ''
+    match = _DEB11TO12_VERSION_RE.match(get_deb11to12_revision())
+    return match.group(1) if match else ''